@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import abc
-import collections
 import enum
 import string
 from typing import Any, ClassVar
@@ -54,7 +53,9 @@ class Game(abc.ABC):
     @classmethod
     def is_word_in_alphabet(cls, word: str) -> bool:
         """Returns True if the given word is entirely made from the game alphabet."""
-        return all(c in cls.ALPHABET for c in word)
+        # Stripping every alphabet character from both ends leaves nothing only if the
+        # whole word is in the alphabet
+        return not word.strip(cls.ALPHABET)
 
     @abc.abstractmethod
     def is_valid_word(self, word: str) -> bool:
@@ -89,9 +90,9 @@ class SingleWordleLikeBaseGame(Game):
 
         self.guess_limit = guess_limit
         self.guesses: list[Guess] = []
-        self.alphabet_states = {
-            c: AlphabetLetterState.NOT_GUESSED for c in self.ALPHABET
-        }
+        self.alphabet_states = dict.fromkeys(
+            self.ALPHABET, AlphabetLetterState.NOT_GUESSED
+        )
         self.game_state = GameState.GUESSING
 
     def guess_word(self, guess_word: str) -> bool:
@@ -123,27 +124,29 @@ class SingleWordleLikeBaseGame(Game):
         the target. They can also transition to FOUND_ELSEWHERE is guessed in the wrong
         position. FOUND_ELSEWHERE words can later transition to FOUND.
         """
+        alphabet_states = self.alphabet_states
         for c, state in guess.guess_letter_states:
+            alphabet_state = alphabet_states[c]
             if state == GuessLetterState.CORRECT:
                 # Transition to FOUND from any state. Could even transition from UNUSED
                 # if the letter was already guessed incorrectly in this word.
-                self.alphabet_states[c] = AlphabetLetterState.FOUND
+                alphabet_states[c] = AlphabetLetterState.FOUND
             elif state == GuessLetterState.ELSEWHERE:
-                if self.alphabet_states[c] != AlphabetLetterState.FOUND:
+                if alphabet_state != AlphabetLetterState.FOUND:
                     # Transition to FOUND_ELSEWHERE from any state except FOUND.
                     # In theory it shouldn't be possible to transition from UNUSED,
                     # because ELSEWHERE should always come before INCORRECT on the same
                     # letter.
-                    assert self.alphabet_states[c] != AlphabetLetterState.UNUSED
-                    self.alphabet_states[c] = AlphabetLetterState.FOUND_ELSEWHERE
+                    assert alphabet_state != AlphabetLetterState.UNUSED
+                    alphabet_states[c] = AlphabetLetterState.FOUND_ELSEWHERE
             else:
                 assert state == GuessLetterState.INCORRECT
-                if self.alphabet_states[c] == AlphabetLetterState.NOT_GUESSED:
+                if alphabet_state == AlphabetLetterState.NOT_GUESSED:
                     # Transition from NOT_GUESSED to UNUSED. A guess letter could be
                     # INCORRECT without the alphabet letter being UNUSED if the letter
                     # is in the guess word multiple times. If the alphabet letter is
                     # still UNUSED by the end of the update, it really is UNUSED.
-                    self.alphabet_states[c] = AlphabetLetterState.UNUSED
+                    alphabet_states[c] = AlphabetLetterState.UNUSED
 
     @property
     def max_guess_word_length(self) -> int | None:
@@ -151,6 +154,8 @@ class SingleWordleLikeBaseGame(Game):
 
 
 class Guess:
+    __slots__ = ("guess_letter_states", "guess_word", "target_word")
+
     def __init__(self, guess_word: str, target_word: str) -> None:
         self.target_word = target_word
         self.guess_word = guess_word
@@ -177,24 +182,41 @@ class Guess:
     def _get_guess_letter_states(
         guess_word: str, target_word: str
     ) -> list[tuple[str, GuessLetterState]]:
-        target_letter_counter = collections.Counter(target_word)
-        guess_letter_states = [(c, GuessLetterState.INCORRECT) for c in guess_word]
-
-        # First mark the correct guesses
-        for i, c in enumerate(guess_word):
-            if len(target_word) > i and target_word[i] == c:
-                guess_letter_states[i] = (c, GuessLetterState.CORRECT)
-                target_letter_counter[c] -= 1
+        # A guess matching the target is entirely correct, so no scoring is needed
+        if guess_word == target_word:
+            return [(c, GuessLetterState.CORRECT) for c in guess_word]
+
+        correct = GuessLetterState.CORRECT
+        elsewhere = GuessLetterState.ELSEWHERE
+        incorrect = GuessLetterState.INCORRECT
+
+        guess_letter_states = [(c, incorrect) for c in guess_word]
+        # Counts of the target letters not already matched by a correct guess letter
+        unmatched_target_letter_counts: dict[str, int] = {}
+
+        # First mark the correct guesses, counting the unmatched target letters
+        for i, (c, target_c) in enumerate(zip(guess_word, target_word, strict=False)):
+            if c == target_c:
+                guess_letter_states[i] = (c, correct)
+            else:
+                unmatched_target_letter_counts[target_c] = (
+                    unmatched_target_letter_counts.get(target_c, 0) + 1
+                )
+        # Target letters beyond the end of the guess can't have been matched
+        for target_c in target_word[len(guess_word) :]:
+            unmatched_target_letter_counts[target_c] = (
+                unmatched_target_letter_counts.get(target_c, 0) + 1
+            )
 
         # Now look for elsewhere guesses, including double letters
-        for i, c in enumerate(guess_word):
+        for i, (c, state) in enumerate(guess_letter_states):
             # Skip if already marked correct
-            if guess_letter_states[i][1] == GuessLetterState.CORRECT:
+            if state == correct:
                 continue
 
-            if c in target_letter_counter and target_letter_counter[c] > 0:
-                guess_letter_states[i] = (c, GuessLetterState.ELSEWHERE)
-                target_letter_counter[c] -= 1
+            if unmatched_target_letter_counts.get(c, 0) > 0:
+                guess_letter_states[i] = (c, elsewhere)
+                unmatched_target_letter_counts[c] -= 1
 
         return guess_letter_states
 
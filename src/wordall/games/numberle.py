@@ -21,7 +21,7 @@ class NumberleGame(game.SingleWordleLikeBaseGame):
         Chooses a target word, which the user must try to guess, randomly.
         """
         number = random.randrange(10**target_word_length)  # noqa: S311
-        return str(number).zfill(target_word_length)
+        return f"{number:0{target_word_length}d}"
 
     def is_valid_word(self, word: str) -> bool:
-        return self.is_word_in_alphabet(word) and len(word) == len(self.target)
+        return len(word) == len(self.target) and self.is_word_in_alphabet(word)
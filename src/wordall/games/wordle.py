@@ -19,7 +19,7 @@ class WordleGame(game.SingleWordleLikeBaseGame):
         super().__init__(guess_limit)
 
         def word_filter_function(word: str) -> bool:
-            return self.is_word_in_alphabet(word) and len(word) == target_word_length
+            return len(word) == target_word_length and self.is_word_in_alphabet(word)
 
         self.word_dictionary = word_dictionary_loader.get_word_dictionary(
             word_transform_function=str.upper,
@@ -36,4 +36,4 @@ class WordleGame(game.SingleWordleLikeBaseGame):
         return random.choice(list(self.word_dictionary))  # noqa: S311
 
     def is_valid_word(self, word: str) -> bool:
-        return word in self.word_dictionary and len(word) == len(self.target)
+        return len(word) == len(self.target) and word in self.word_dictionary
@@ -1,10 +1,11 @@
-from typing import ClassVar, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
-from rich import text
+from rich import style, text
 from textual import app as textual_app
 from textual import reactive, widgets
 
 from wordall import game
+from wordall.tui import letter_states
 
 T = TypeVar("T", bound=game.Game)
 
@@ -19,30 +20,42 @@ GameWithAlphabetLetterStates = game.SingleWordleLikeBaseGame
 
 
 class AlphabetLetterStateDisplay(AlphabetDisplay[GameWithAlphabetLetterStates]):
-    alphabet_letter_state_to_style: ClassVar[dict[game.AlphabetLetterState, str]] = {
-        game.AlphabetLetterState.FOUND: "black on dark_green",
-        game.AlphabetLetterState.FOUND_ELSEWHERE: "black on yellow",
-        game.AlphabetLetterState.UNUSED: "white on black",
-        game.AlphabetLetterState.NOT_GUESSED: "black on white",
+    alphabet_letter_state_to_style: ClassVar[
+        dict[game.AlphabetLetterState, style.Style]
+    ] = {
+        game.AlphabetLetterState.FOUND: style.Style.parse("black on dark_green"),
+        game.AlphabetLetterState.FOUND_ELSEWHERE: style.Style.parse("black on yellow"),
+        game.AlphabetLetterState.UNUSED: style.Style.parse("white on black"),
+        game.AlphabetLetterState.NOT_GUESSED: style.Style.parse("black on white"),
     }
 
+    SEPARATOR: ClassVar[str] = " "
+
     game_: reactive.Reactive[GameWithAlphabetLetterStates | None] = reactive.reactive(
         None
     )
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Most guesses only change a few letter states, and the display is also
+        # refreshed when none change. Stores the states and the text rendered for them.
+        self._last_render: (
+            tuple[tuple[tuple[str, game.AlphabetLetterState], ...], text.Text] | None
+        ) = None
+
     def render(self) -> textual_app.RenderResult:
-        assert self.game_ is not None
+        game_ = self.game_
+        assert game_ is not None
         # Not sure mypy can reach here
-        assert isinstance(self.game_, GameWithAlphabetLetterStates)
+        assert isinstance(game_, GameWithAlphabetLetterStates)
 
-        separator = text.Text(" ")
-        return separator.join(
-            self.render_alphabet_letter_state(c, state)
-            for c, state in self.game_.alphabet_states.items()
-        )
+        alphabet_states = tuple(game_.alphabet_states.items())
+        last_render = self._last_render
+        if last_render is not None and last_render[0] == alphabet_states:
+            return last_render[1]
 
-    @classmethod
-    def render_alphabet_letter_state(
-        cls, c: str, state: game.AlphabetLetterState
-    ) -> text.Text:
-        return text.Text(c, style=cls.alphabet_letter_state_to_style[state])
+        rendered = letter_states.render_letter_states(
+            alphabet_states, self.alphabet_letter_state_to_style, self.SEPARATOR
+        )
+        self._last_render = (alphabet_states, rendered)
+        return rendered
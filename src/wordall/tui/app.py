@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import pathlib
 from typing import Any, ClassVar
 
@@ -47,6 +48,33 @@ GAME_REGISTRY = {
 }
 
 
+@functools.cache
+def get_wordle_word_dictionary_loader(
+    target_word_length: int,
+) -> word_dictionary_loaders.WordDictionaryLoader:
+    """
+    Returns a loader for the SCOWL words usable in wordle games with the given word
+    length. The word list is read, uppercased and filtered once per length for the
+    lifetime of the process, so later games start from the prepared words.
+    """
+    scowl_path = (
+        pathlib.Path(__file__).parent.parent / "resources/scowl-2020.12.07/final"
+    ).resolve()
+    scowl_loader = word_dictionary_loaders.ScowlWordListLoader(scowl_path, 70)
+
+    def word_filter_function(word: str) -> bool:
+        if len(word) != target_word_length:
+            return False
+        return wordle.WordleGame.is_word_in_alphabet(word)
+
+    return word_dictionary_loaders.PreloadedLoader(
+        scowl_loader.get_word_dictionary(
+            word_transform_function=str.upper,
+            word_filter_function=word_filter_function,
+        )
+    )
+
+
 class WordallApp(textual_app.App[None]):
     BINDINGS: ClassVar[list[binding.BindingType]] = [
         binding.Binding("ctrl+n", "new_game", "New Game")
@@ -56,6 +84,12 @@ class WordallApp(textual_app.App[None]):
 
     game_: reactive.Reactive[game_module.Game | None] = reactive.reactive(None)
 
+    # Widgets that are updated after every guess, kept by compose
+    game_container: "UnfocusableScrollableContainer"
+    game_messages: widgets.Label
+    guess_input_: guess_input.GuessInput
+    guess_validator: "ValidGuessWord"
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.game_key = "wordle"
@@ -65,15 +99,8 @@ class WordallApp(textual_app.App[None]):
         # TODO: Obviously still needs work to load args/kwargs properly and use game
         # class from registry
         if game_key == "wordle":
-            scowl_path = (
-                pathlib.Path(__file__).parent.parent
-                / "resources/scowl-2020.12.07/final"
-            ).resolve()
             return wordle.WordleGame(
-                word_dictionary_loaders.ScowlWordListLoader(
-                    scowl_path,
-                    70,
-                ),
+                get_wordle_word_dictionary_loader(5),
                 guess_limit=6,
                 target_word_length=5,
             )
@@ -86,22 +113,26 @@ class WordallApp(textual_app.App[None]):
         assert self.game_ is not None
 
         yield widgets.Header()
-        with UnfocusableScrollableContainer():
+        self.game_container = UnfocusableScrollableContainer()
+        with self.game_container:
             yield (
                 GAME_REGISTRY[self.game_key]
                 .guesses_display_class()
                 .data_bind(WordallApp.game_)
             )
-            yield guess_input.GuessInput(
+            self.guess_validator = ValidGuessWord(self.game_)
+            self.guess_input_ = guess_input.GuessInput(
                 max_length=self.game_.max_guess_word_length,
-                validators=ValidGuessWord(self.game_),
+                validators=self.guess_validator,
             )
+            yield self.guess_input_
             yield (
                 GAME_REGISTRY[self.game_key]
                 .alphabet_display_class()
                 .data_bind(WordallApp.game_)
             )
-            yield widgets.Label("New Game Started.", id="game_messages")
+            self.game_messages = widgets.Label("New Game Started.", id="game_messages")
+            yield self.game_messages
             yield StatusDisplay().data_bind(WordallApp.game_)
         yield widgets.Footer()
 
@@ -110,37 +141,73 @@ class WordallApp(textual_app.App[None]):
         assert self.game_ is not None
         assert self.game_.game_state == game_module.GameState.GUESSING
 
-        label = self.query_exactly_one("#game_messages", widgets.Label)
+        label = self.game_messages
 
         if event.validation_result is not None and not event.validation_result.is_valid:
             label.update(f"Invalid guess: {event.value}")
             return
 
         try:
-            game_ended = self.game_.guess_word(event.value.upper())
+            # GuessInput uppercases all text as it is entered, so no conversion needed
+            game_ended = self.game_.guess_word(event.value)
         except (
             game_module.InvalidGuessWordError
         ) as e:  # pragma: no cover  # Not possible normally
             label.update(f"ERROR: {e}")
             return
 
-        label.update(f"Guessed: {event.value}")
-        self.mutate_reactive(WordallApp.game_)
-        event.input.clear()
-
-        if game_ended:
-            container = self.query_exactly_one(UnfocusableScrollableContainer)
-            container.mount(
-                GAME_REGISTRY[self.game_key]
-                .target_display_class()
-                .data_bind(WordallApp.game_)
-            )
-            event.input.disabled = True
-            self.is_game_over = True
+        # Apply all of the resulting UI changes in a single repaint
+        with self.batch_update():
+            label.update(f"Guessed: {event.value}")
+            self.mutate_reactive(WordallApp.game_)
+            event.input.clear()
+
+            if game_ended:
+                self.game_container.mount(
+                    GAME_REGISTRY[self.game_key]
+                    .target_display_class()
+                    .data_bind(WordallApp.game_)
+                )
+                event.input.disabled = True
+                self.is_game_over = True
 
     def action_new_game(self) -> None:
-        self.game_ = self.get_game(self.game_key)
-        self.refresh(recompose=True)
+        old_game = self.game_
+        assert old_game is not None
+        new_game = self.get_game(self.game_key)
+
+        if not self._has_same_layout(old_game, new_game):
+            self.game_ = new_game
+            self.refresh(recompose=True)
+            return
+
+        # The existing widgets fit the new game, so reset them rather than rebuilding
+        # the whole widget tree. Data bound displays update from the new game.
+        with self.batch_update():
+            self.game_ = new_game
+            self.guess_validator.game_ = new_game
+            self.game_container.query(target_displays.TargetDisplay).remove()
+            self.guess_input_.clear()
+            self.guess_input_.disabled = False
+            self.guess_input_.focus()
+            self.game_messages.update("New Game Started.")
+
+    @staticmethod
+    def _has_same_layout(
+        old_game: game_module.Game, new_game: game_module.Game
+    ) -> bool:
+        """
+        Returns True if the widgets composed for the old game can be reused for the new
+        game, i.e. it is the same kind of wordle-like game with the same guess limit and
+        length. Other kinds of game are always recomposed.
+        """
+        return (
+            type(old_game) is type(new_game)
+            and isinstance(old_game, game_module.SingleWordleLikeBaseGame)
+            and isinstance(new_game, game_module.SingleWordleLikeBaseGame)
+            and old_game.guess_limit == new_game.guess_limit
+            and old_game.max_guess_word_length == new_game.max_guess_word_length
+        )
 
 
 class UnfocusableScrollableContainer(containers.ScrollableContainer, can_focus=False):
@@ -168,7 +235,8 @@ class ValidGuessWord(validation.Validator):
 
     def validate(self, value: str) -> validation.ValidationResult:
         """Check a string is equal to its reverse."""
-        if self.game_.is_valid_word(value.upper()):
+        # Only used with GuessInput, which already holds uppercase text
+        if self.game_.is_valid_word(value):
             return self.success()
         else:
             return self.failure("Invalid guess")
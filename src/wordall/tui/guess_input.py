@@ -12,6 +12,8 @@ class GuessInput(widgets.Input):
         # Width needs to account for spacing (see InputSpacingWrapper)
         if self.max_length:
             self.styles.width = (self.max_length * 2) - 1
+        # Reused across renders so that it can cache the spaced values
+        self._spacing_wrapper = InputSpacingWrapper(self)
 
     def on_mount(self) -> None:
         self.focus()
@@ -34,7 +36,7 @@ class GuessInput(widgets.Input):
         # be an alternative, but then other behaviour like deletion and cursor movement
         # needs to be changed. Instead we use a hack to wrap the GuessInput provided to
         # _InputRenderable and make it look like it has spacing in the value here only.
-        return _input._InputRenderable(InputSpacingWrapper(self), self._cursor_visible)  # type: ignore  # noqa SLF001
+        return _input._InputRenderable(self._spacing_wrapper, self._cursor_visible)  # type: ignore  # noqa SLF001
 
 
 class InputSpacingWrapper:
@@ -48,24 +50,39 @@ class InputSpacingWrapper:
 
     def __init__(self, input_instance: widgets.Input):
         self._wrapped_input = input_instance
+        # The spaced value is rebuilt only when the input's own value changes. Stores
+        # the input value and the spaced value built from it.
+        self._spaced_value_cache: tuple[str, str] | None = None
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._wrapped_input, name)
 
     @property
     def value(self) -> str:
-        # Add an extra separator at the end so the cursor renders properly when at the
-        # end
-        value = self.SEPARATOR.join(self._wrapped_input.value)
-        return value + self.SEPARATOR
+        wrapped_value = self._wrapped_input.value
+        if (
+            self._spaced_value_cache is None
+            or self._spaced_value_cache[0] != wrapped_value
+        ):
+            # Add an extra separator at the end so the cursor renders properly when at
+            # the end
+            value = self.SEPARATOR.join(wrapped_value) + self.SEPARATOR
+            self._spaced_value_cache = (wrapped_value, value)
+        return self._spaced_value_cache[1]
 
     @property
     def _value(self) -> text.Text:
+        wrapped_value: text.Text = self._wrapped_input._value  # noqa: SLF001
         # Add an extra separator at the end so the cursor renders properly when at the
-        # end
-        separated_value: list[text.Text] = list(self._wrapped_input._value)  # type: ignore  # noqa SLF001  # mypy doesn't know about splitting up a Text
-        value = text.Text(self.SEPARATOR).join(separated_value)
-        return value + text.Text(self.SEPARATOR)
+        # end. Each character's styling is moved along to match the spacing.
+        return text.Text(
+            self.SEPARATOR.join(wrapped_value.plain) + self.SEPARATOR,
+            spans=[
+                text.Span(i * 2, (i * 2) + 1, span.style)
+                for span in wrapped_value.spans
+                for i in range(span.start, span.end)
+            ],
+        )
 
     @property
     def cursor_position(self) -> int:
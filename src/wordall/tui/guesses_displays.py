@@ -1,10 +1,12 @@
+import functools
 from typing import Any, ClassVar, Generic, TypeVar
 
-from rich import text
+from rich import style, text
 from textual import app as textual_app
 from textual import reactive, widgets
 
 from wordall import game
+from wordall.tui import letter_states
 
 T = TypeVar("T", bound=game.Game)
 
@@ -33,49 +35,101 @@ class GuessesFromListDisplay(GuessesDisplay[GameWithGuessList]):
                 yield GuessFromListDisplay(i).data_bind(GuessesFromListDisplay.game_)
 
     def watch_game_(
-        self, _old_game: GameWithGuessList | None, _new_game: GameWithGuessList | None
+        self, _old_game: GameWithGuessList | None, new_game: GameWithGuessList | None
     ) -> None:
-        if self.game_ is None or self.game_.guess_limit is not None:
+        if new_game is None or new_game.guess_limit is not None:
             return
 
-        if len(self.game_.guesses) > len(self.children):
-            for i in range(len(self.children), len(self.game_.guesses)):
+        guess_count = len(new_game.guesses)
+        child_count = len(self.children)
+        if guess_count > child_count:
+            for i in range(child_count, guess_count):
                 new_child = GuessFromListDisplay(i).data_bind(
                     GuessesFromListDisplay.game_
                 )
                 self.mount(new_child)
+        elif guess_count < child_count:
+            # A new game has been bound in place of the old one
+            self.remove_children(self.children[guess_count:])
 
 
 class GuessFromListDisplay(widgets.Static):
-    guess_letter_state_to_style: ClassVar[dict[game.GuessLetterState, str]] = {
-        game.GuessLetterState.CORRECT: "black on dark_green",
-        game.GuessLetterState.ELSEWHERE: "black on yellow",
-        game.GuessLetterState.INCORRECT: "white on black",
+    guess_letter_state_to_style: ClassVar[dict[game.GuessLetterState, style.Style]] = {
+        game.GuessLetterState.CORRECT: style.Style.parse("black on dark_green"),
+        game.GuessLetterState.ELSEWHERE: style.Style.parse("black on yellow"),
+        game.GuessLetterState.INCORRECT: style.Style.parse("white on black"),
     }
 
-    game_: reactive.Reactive[GameWithGuessList | None] = reactive.reactive(None)
+    SEPARATOR: ClassVar[str] = " "
+
+    # Repainted by watch_game_ only when this row changes, as every row is bound to the
+    # same game and most guesses only change one row
+    game_: reactive.Reactive[GameWithGuessList | None] = reactive.reactive(
+        None, repaint=False
+    )
 
     def __init__(self, guess_number: int, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.guess_number = guess_number
+        # Submitted guesses never change, so the row only needs rebuilding when its
+        # guess (or lack of one) changes. Stores the key and the text rendered for it.
+        self._last_render: (
+            tuple[tuple[game.Guess | None, int | None], text.Text] | None
+        ) = None
+
+    def watch_game_(
+        self, _old_game: GameWithGuessList | None, new_game: GameWithGuessList | None
+    ) -> None:
+        last_render = self._last_render
+        if (
+            new_game is None
+            or last_render is None
+            or last_render[0] != self._get_render_key(new_game)
+        ):
+            self.refresh()
 
     def render(self) -> textual_app.RenderResult:
-        assert self.game_ is not None
-
-        separator = text.Text(" ")
-        if len(self.game_.guesses) > self.guess_number:
-            guess = self.game_.guesses[self.guess_number]
-            return separator.join(
-                self.render_guess_letter_state(c, state)
-                for c, state in guess.guess_letter_states
+        game_ = self.game_
+        assert game_ is not None
+
+        render_key = self._get_render_key(game_)
+        last_render = self._last_render
+        if last_render is not None and last_render[0] == render_key:
+            return last_render[1]
+
+        rendered = self._render_guess(*render_key)
+        self._last_render = (render_key, rendered)
+        return rendered
+
+    def _get_render_key(
+        self, game_: GameWithGuessList
+    ) -> tuple[game.Guess | None, int | None]:
+        """Returns the parts of the game this row is rendered from."""
+        guesses = game_.guesses
+        guess = guesses[self.guess_number] if len(guesses) > self.guess_number else None
+        return (guess, game_.max_guess_word_length)
+
+    @classmethod
+    def _render_guess(
+        cls, guess: game.Guess | None, max_guess_word_length: int | None
+    ) -> text.Text:
+        if guess is not None:
+            return letter_states.render_letter_states(
+                guess.guess_letter_states,
+                cls.guess_letter_state_to_style,
+                cls.SEPARATOR,
             )
-        elif self.game_.max_guess_word_length is not None:
-            return separator.join([text.Text("#")] * self.game_.max_guess_word_length)
         else:
-            return text.Text("#")
+            return cls._render_empty_guess(max_guess_word_length)
 
     @classmethod
-    def render_guess_letter_state(
-        cls, c: str, state: game.GuessLetterState
-    ) -> text.Text:
-        return text.Text(c, style=cls.guess_letter_state_to_style[state])
+    @functools.cache
+    def _render_empty_guess(cls, max_guess_word_length: int | None) -> text.Text:
+        """
+        Renders the placeholder for a row without a guess. Cached, as it is the same for
+        every empty row of every game with the same word length.
+        """
+        if max_guess_word_length is not None:
+            return text.Text(cls.SEPARATOR.join("#" * max_guess_word_length))
+        else:
+            return text.Text("#")
@@ -0,0 +1,23 @@
+import enum
+from collections import abc as collections_abc
+from typing import TypeVar
+
+from rich import style, text
+
+S = TypeVar("S", bound=enum.Enum)
+
+
+def render_letter_states(
+    letter_states: collections_abc.Iterable[tuple[str, S]],
+    state_to_style: collections_abc.Mapping[S, style.Style],
+    separator: str = " ",
+) -> text.Text:
+    """
+    Renders each letter in the style for its state, with the separator between letters.
+    """
+    rendered = text.Text()
+    for c, state in letter_states:
+        if rendered:
+            rendered.append(separator)
+        rendered.append(c, style=state_to_style[state])
+    return rendered
@@ -1,9 +1,20 @@
 import abc
 import enum
+import fnmatch
 import pathlib
 from collections import abc as collections_abc
 
 
+# Default transform and filter functions. Named so that loaders can tell when they have
+# not been replaced, and skip calling them for every word.
+def _no_transform(word: str) -> str:
+    return word
+
+
+def _no_filter(_word: str) -> bool:
+    return True
+
+
 class WordDictionaryLoader(abc.ABC):
     """
     Base class for loading a word dictionary (the set of words to be used in some way in
@@ -13,8 +24,8 @@ class WordDictionaryLoader(abc.ABC):
     @abc.abstractmethod
     def get_word_dictionary(
         self,
-        word_transform_function: collections_abc.Callable[[str], str] = lambda w: w,
-        word_filter_function: collections_abc.Callable[[str], bool] = lambda _: True,
+        word_transform_function: collections_abc.Callable[[str], str] = _no_transform,
+        word_filter_function: collections_abc.Callable[[str], bool] = _no_filter,
     ) -> set[str]:
         """
         Returns the word dictionary. If word_transform_function is supplied, applies
@@ -39,8 +50,8 @@ class SimpleFileLoader(WordDictionaryLoader):
 
     def get_word_dictionary(
         self,
-        word_transform_function: collections_abc.Callable[[str], str] = lambda w: w,
-        word_filter_function: collections_abc.Callable[[str], bool] = lambda _: True,
+        word_transform_function: collections_abc.Callable[[str], str] = _no_transform,
+        word_filter_function: collections_abc.Callable[[str], bool] = _no_filter,
     ) -> set[str]:
         word_dictionary = _read_word_dictionary_file(
             self.dictionary_file_path,
@@ -69,22 +80,17 @@ class MultipleFileLoader(WordDictionaryLoader):
 
     def get_word_dictionary(
         self,
-        word_transform_function: collections_abc.Callable[[str], str] = lambda w: w,
-        word_filter_function: collections_abc.Callable[[str], bool] = lambda _: True,
+        word_transform_function: collections_abc.Callable[[str], str] = _no_transform,
+        word_filter_function: collections_abc.Callable[[str], bool] = _no_filter,
     ) -> set[str]:
         word_dictionary: set[str] = set()
 
-        if self.dictionary_file_paths:
-            word_dictionary = set.union(
-                *(
-                    _read_word_dictionary_file(
-                        dictionary_file_path,
-                        word_filter_function=word_filter_function,
-                        word_transform_function=word_transform_function,
-                        encoding=self.encoding,
-                    )
-                    for dictionary_file_path in self.dictionary_file_paths
-                )
+        for dictionary_file_path in self.dictionary_file_paths:
+            word_dictionary |= _read_word_dictionary_file(
+                dictionary_file_path,
+                word_filter_function=word_filter_function,
+                word_transform_function=word_transform_function,
+                encoding=self.encoding,
             )
 
         if not word_dictionary:
@@ -136,6 +142,7 @@ class ScowlWordListLoader(MultipleFileLoader):
         if included_subcategories is None:
             included_subcategories = [ScowlWordSubcategory.WORDS]
 
+        directory_paths = list(scowl_final_directory_path.iterdir())
         dictionary_file_paths = []
 
         for language_category_or_none in [None, language_category]:
@@ -147,7 +154,7 @@ class ScowlWordListLoader(MultipleFileLoader):
                 for subcategory in included_subcategories:
                     dictionary_file_paths.extend(
                         self._get_matching_files(
-                            scowl_final_directory_path,
+                            directory_paths,
                             category_name,
                             subcategory.name.lower().replace("_", "-"),
                             max_size,
@@ -175,18 +182,18 @@ class ScowlWordListLoader(MultipleFileLoader):
     @classmethod
     def _get_matching_files(
         cls,
-        scowl_final_directory_path: pathlib.Path,
+        directory_paths: list[pathlib.Path],
         category_name: str,
         sub_category_name: str,
         max_size: int,
     ) -> list[pathlib.Path]:
-        glob_results = scowl_final_directory_path.glob(
-            f"{category_name}-{sub_category_name}.*"
-        )
+        pattern = f"{category_name}-{sub_category_name}.*"
         return [
             p
-            for p in glob_results
-            if p.is_file() and cls._get_word_list_size(p) <= max_size
+            for p in directory_paths
+            if fnmatch.fnmatchcase(p.name, pattern)
+            and p.is_file()
+            and cls._get_word_list_size(p) <= max_size
         ]
 
     @staticmethod
@@ -194,21 +201,58 @@ class ScowlWordListLoader(MultipleFileLoader):
         return int(scowl_word_list_path.suffix[1:])
 
 
+class PreloadedLoader(WordDictionaryLoader):
+    """
+    Provides the word dictionary from words that are already in memory, e.g. words
+    prepared once by another loader and shared between several games.
+    """
+
+    def __init__(self, words: collections_abc.Iterable[str]) -> None:
+        self.words = frozenset(words)
+
+    def get_word_dictionary(
+        self,
+        word_transform_function: collections_abc.Callable[[str], str] = _no_transform,
+        word_filter_function: collections_abc.Callable[[str], bool] = _no_filter,
+    ) -> set[str]:
+        if (
+            word_transform_function is _no_transform
+            and word_filter_function is _no_filter
+        ):
+            word_dictionary = set(self.words)
+        else:
+            word_dictionary = {
+                word
+                for preloaded_word in self.words
+                if word_filter_function(word := word_transform_function(preloaded_word))
+            }
+
+        if not word_dictionary:
+            raise NoWordsFoundError("No words loaded")
+
+        return word_dictionary
+
+
 class NoWordsFoundError(Exception):
     pass
 
 
 def _read_word_dictionary_file(
     dictionary_file_path: pathlib.Path,
-    word_transform_function: collections_abc.Callable[[str], str] = lambda w: w,
-    word_filter_function: collections_abc.Callable[[str], bool] = lambda _: True,
+    word_transform_function: collections_abc.Callable[[str], str] = _no_transform,
+    word_filter_function: collections_abc.Callable[[str], bool] = _no_filter,
     encoding: str | None = None,
 ) -> set[str]:
     with dictionary_file_path.open(encoding=encoding) as dictionary_file:
-        all_words = [
-            word_transform_function(line_)
+        if (
+            word_transform_function is _no_transform
+            and word_filter_function is _no_filter
+        ):
+            return {line_ for line in dictionary_file if (line_ := line.strip())}
+
+        return {
+            word
             for line in dictionary_file
             if (line_ := line.strip())
-        ]
-
-    return {word for word in all_words if word_filter_function(word)}
+            and word_filter_function(word := word_transform_function(line_))
+        }
@@ -19,6 +19,9 @@ class TestGameIsWordInAlphabet:
     def test_not_in_alphabet(self, non_abstract_game: game.Game) -> None:
         assert not non_abstract_game.is_word_in_alphabet("AB1")
 
+    def test_not_in_alphabet_middle(self, non_abstract_game: game.Game) -> None:
+        assert not non_abstract_game.is_word_in_alphabet("A1B")
+
 
 class TestSingleWordleLikeBaseGameGuessWord:
     """
@@ -372,11 +372,14 @@ class TestScowlWordListLoader:
 
     def test_selects_word_files_only(self, mocker: pytest_mock.MockerFixture) -> None:
         base_path_mock = mocker.MagicMock(pathlib.Path)
-        # Expected to glob once for english words and once for british words
-        base_path_mock.glob.side_effect = (
-            [pathlib.Path("/a/english-words.10"), pathlib.Path("/a/english-words.60")],
-            [pathlib.Path("/a/british-words.25")],
-        )
+        # Expected to match english words and british words only
+        base_path_mock.iterdir.return_value = [
+            pathlib.Path("/a/british-words.25"),
+            pathlib.Path("/a/english-words.10"),
+            pathlib.Path("/a/english-abbreviations.10"),
+            pathlib.Path("/a/english-words.60"),
+            pathlib.Path("/a/american-words.10"),
+        ]
 
         is_file_mock = mocker.patch("pathlib.Path.is_file")
         is_file_mock.return_value = True
@@ -389,20 +392,20 @@ class TestScowlWordListLoader:
             pathlib.Path("/a/english-words.60"),
             pathlib.Path("/a/british-words.25"),
         ]
-        assert base_path_mock.glob.mock_calls == [
-            mocker.call("english-words.*"),
-            mocker.call("british-words.*"),
-        ]
+        # The directory should only be listed once
+        base_path_mock.iterdir.assert_called_once_with()
 
     def test_ignores_files_over_max_size(
         self, mocker: pytest_mock.MockerFixture
     ) -> None:
         base_path_mock = mocker.MagicMock(pathlib.Path)
-        # Expected to glob once for english words and once for british words
-        base_path_mock.glob.side_effect = (
-            [pathlib.Path("/a/english-words.20"), pathlib.Path("/a/english-words.55")],
-            [pathlib.Path("/a/british-words.50"), pathlib.Path("/a/british-words.51")],
-        )
+        # Expected to match english words and british words
+        base_path_mock.iterdir.return_value = [
+            pathlib.Path("/a/english-words.20"),
+            pathlib.Path("/a/english-words.55"),
+            pathlib.Path("/a/british-words.50"),
+            pathlib.Path("/a/british-words.51"),
+        ]
 
         is_file_mock = mocker.patch("pathlib.Path.is_file")
         is_file_mock.return_value = True
@@ -423,11 +426,13 @@ class TestScowlWordListLoader:
         self, mocker: pytest_mock.MockerFixture
     ) -> None:
         base_path_mock = mocker.MagicMock(pathlib.Path)
-        # Expected to glob once for english words and once for american words
-        base_path_mock.glob.side_effect = (
-            [pathlib.Path("/a/english-words.20"), pathlib.Path("/a/english-words.40")],
-            [pathlib.Path("/a/american-words.60")],
-        )
+        # Expected to match english words and american words only
+        base_path_mock.iterdir.return_value = [
+            pathlib.Path("/a/english-words.20"),
+            pathlib.Path("/a/british-words.60"),
+            pathlib.Path("/a/english-words.40"),
+            pathlib.Path("/a/american-words.60"),
+        ]
 
         is_file_mock = mocker.patch("pathlib.Path.is_file")
         is_file_mock.return_value = True
@@ -443,14 +448,10 @@ class TestScowlWordListLoader:
             pathlib.Path("/a/english-words.40"),
             pathlib.Path("/a/american-words.60"),
         ]
-        assert base_path_mock.glob.mock_calls == [
-            mocker.call("english-words.*"),
-            mocker.call("american-words.*"),
-        ]
 
     def test_includes_variants(self, mocker: pytest_mock.MockerFixture) -> None:
         base_path_mock = mocker.MagicMock(pathlib.Path)
-        # Expected to glob 3 times for english words and 3 times for american words
+        # Expected to match 3 english word lists and 3 american word lists
         # American variant file names are a special case
         expected_file_names = [
             "english-words.20",
@@ -461,9 +462,10 @@ class TestScowlWordListLoader:
             "variant_2-words.20",
         ]
 
-        # One filename per glob
-        base_path_mock.glob.side_effect = [
-            [pathlib.Path(f"/a/{fn}")] for fn in expected_file_names
+        # Listed in reverse, along with a variant that is not included
+        base_path_mock.iterdir.return_value = [
+            pathlib.Path(f"/a/{fn}")
+            for fn in reversed([*expected_file_names, "variant_3-words.20"])
         ]
 
         is_file_mock = mocker.patch("pathlib.Path.is_file")
@@ -475,16 +477,11 @@ class TestScowlWordListLoader:
             language_category=word_dictionary_loaders.ScowlLanguageCategory.AMERICAN,
             max_variants=2,
         )
-        # All glob results should be in dictionary_file_paths
+        # All matching files should be in dictionary_file_paths, in category order
         assert loader.dictionary_file_paths == [
             pathlib.Path(f"/a/{fn}") for fn in expected_file_names
         ]
 
-        # All globs should be made
-        assert base_path_mock.glob.mock_calls == [
-            mocker.call(fn.replace("20", "*")) for fn in expected_file_names
-        ]
-
     def test_raises_error_when_max_variants_too_big(self) -> None:
         with pytest.raises(ValueError, match="Max variant"):
             word_dictionary_loaders.ScowlWordListLoader(
@@ -495,7 +492,7 @@ class TestScowlWordListLoader:
         self, mocker: pytest_mock.MockerFixture
     ) -> None:
         base_path_mock = mocker.MagicMock(pathlib.Path)
-        # Expected to glob each subcategory except words for english and british
+        # Expected to match each subcategory except words for english and british
         expected_file_names = [
             "english-abbreviations.20",
             "english-contractions.20",
@@ -507,9 +504,12 @@ class TestScowlWordListLoader:
             "british-upper.20",
         ]
 
-        # One filename per glob
-        base_path_mock.glob.side_effect = [
-            [pathlib.Path(f"/a/{fn}")] for fn in expected_file_names
+        # Listed in reverse, along with the words that are not included
+        base_path_mock.iterdir.return_value = [
+            pathlib.Path(f"/a/{fn}")
+            for fn in reversed(
+                [*expected_file_names, "english-words.20", "british-words.20"]
+            )
         ]
 
         is_file_mock = mocker.patch("pathlib.Path.is_file")
@@ -526,26 +526,21 @@ class TestScowlWordListLoader:
                 word_dictionary_loaders.ScowlWordSubcategory.UPPER,
             ],
         )
-        # All glob results should be in dictionary_file_paths
+        # All matching files should be in dictionary_file_paths, in category order
         assert loader.dictionary_file_paths == [
             pathlib.Path(f"/a/{fn}") for fn in expected_file_names
         ]
 
-        # All globs should be made
-        assert base_path_mock.glob.mock_calls == [
-            mocker.call(fn.replace("20", "*")) for fn in expected_file_names
-        ]
-
     def test_uses_iso8859_1_by_default(
         self,
         mocker: pytest_mock.MockerFixture,
     ) -> None:
         base_path_mock = mocker.MagicMock(pathlib.Path)
-        # Expected to glob once for english words and once for british words
-        base_path_mock.glob.side_effect = (
-            [pathlib.Path("/a/english-words.10"), pathlib.Path("/a/english-words.60")],
-            [pathlib.Path("/a/british-words.25")],
-        )
+        base_path_mock.iterdir.return_value = [
+            pathlib.Path("/a/english-words.10"),
+            pathlib.Path("/a/english-words.60"),
+            pathlib.Path("/a/british-words.25"),
+        ]
 
         is_file_mock = mocker.patch("pathlib.Path.is_file")
         is_file_mock.return_value = True
@@ -554,3 +549,34 @@ class TestScowlWordListLoader:
             base_path_mock, 100, max_variants=0
         )
         assert loader.encoding == "iso8859-1"
+
+
+class TestPreloadedLoader:
+    def test_loads_word_dictionary(self) -> None:
+        loader = word_dictionary_loaders.PreloadedLoader({"apple", "bread", "chip!"})
+        word_dictionary = loader.get_word_dictionary()
+
+        assert word_dictionary == {"apple", "bread", "chip!"}
+
+    def test_returns_new_word_dictionary_each_time(self) -> None:
+        loader = word_dictionary_loaders.PreloadedLoader({"apple", "bread", "chip!"})
+        loader.get_word_dictionary().clear()
+        word_dictionary = loader.get_word_dictionary()
+
+        assert word_dictionary == {"apple", "bread", "chip!"}
+
+    def test_transforms_before_filtering(self) -> None:
+        def upper_letters_only(word: str) -> bool:
+            return all(c in string.ascii_uppercase for c in word)
+
+        loader = word_dictionary_loaders.PreloadedLoader({"apple", "bread", "chip!"})
+        word_dictionary = loader.get_word_dictionary(
+            word_transform_function=str.upper, word_filter_function=upper_letters_only
+        )
+
+        assert word_dictionary == {"APPLE", "BREAD"}
+
+    def test_raises_exception_on_effective_empty_dictionary(self) -> None:
+        loader = word_dictionary_loaders.PreloadedLoader({"apple", "bread", "chip!"})
+        with pytest.raises(word_dictionary_loaders.NoWordsFoundError):
+            loader.get_word_dictionary(word_filter_function=lambda _: False)
@@ -160,6 +160,19 @@ class TestGuessSubmission:
             guess_renderable = guess_widgets[1].render()
             assert " ".join("CHIPS") in str(guess_renderable)
 
+    async def test_lowercase_guess_submitted_uppercased(
+        self, app_with_wordle_game: app_module.WordallApp
+    ) -> None:
+        app = app_with_wordle_game
+        game = cast(wordle.WordleGame, app.game_)
+
+        async with app.run_test() as pilot:
+            assert "BREAD" in game.word_dictionary
+            await pilot.press("b", "r", "e", "a", "d", "enter")
+
+            assert len(game.guesses) == 1
+            assert game.guesses[0].guess_word == "BREAD"
+
     async def test_valid_guess_displayed_when_no_guess_limit(
         self, app_with_wordle_game_no_limit: app_module.WordallApp
     ) -> None:
@@ -188,6 +201,47 @@ class TestGuessSubmission:
             guess_renderable = guesses_widget.children[1].render()
             assert " ".join("CHIPS") in str(guess_renderable)
 
+    async def test_unchanged_guess_rows_reuse_render(
+        self, app_with_wordle_game: app_module.WordallApp
+    ) -> None:
+        app = app_with_wordle_game
+        game = cast(wordle.WordleGame, app.game_)
+        assert "APPLE" in game.word_dictionary
+        game.target = "APPLE"
+
+        async with app.run_test() as pilot:
+            guess_widgets = app.query(guesses_displays.GuessFromListDisplay)
+            first_row_renderable = guess_widgets[0].render()
+            second_row_renderable = guess_widgets[1].render()
+
+            assert "BREAD" in game.word_dictionary
+            await pilot.press("B", "R", "E", "A", "D", "enter")
+
+            assert guess_widgets[0].render() is not first_row_renderable
+            assert " ".join("BREAD") in str(guess_widgets[0].render())
+            assert guess_widgets[1].render() is second_row_renderable
+
+    async def test_unchanged_guess_rows_not_repainted(
+        self,
+        app_with_wordle_game: app_module.WordallApp,
+        mocker: pytest_mock.MockerFixture,
+    ) -> None:
+        app = app_with_wordle_game
+        game = cast(wordle.WordleGame, app.game_)
+        assert "APPLE" in game.word_dictionary
+        game.target = "APPLE"
+
+        async with app.run_test() as pilot:
+            guess_widgets = app.query(guesses_displays.GuessFromListDisplay)
+            first_row_refresh_spy = mocker.spy(guess_widgets[0], "refresh")
+            second_row_refresh_spy = mocker.spy(guess_widgets[1], "refresh")
+
+            assert "BREAD" in game.word_dictionary
+            await pilot.press("B", "R", "E", "A", "D", "enter")
+
+            first_row_refresh_spy.assert_called()
+            second_row_refresh_spy.assert_not_called()
+
     async def test_valid_guess_letter_statuses_shown(
         self, app_with_wordle_game: app_module.WordallApp
     ) -> None:
@@ -307,3 +361,72 @@ class TestNewGame:
         async with app.run_test() as pilot:
             await pilot.press("ctrl+n")
             assert app.game_ is not old_game
+
+    async def test_new_game_resets_reused_widgets(
+        self, app_with_wordle_game: app_module.WordallApp
+    ) -> None:
+        app = app_with_wordle_game
+        game = cast(wordle.WordleGame, app.game_)
+        game.target = "APPLE"
+
+        async with app.run_test() as pilot:
+            guess_input = app.query_exactly_one(guess_input_module.GuessInput)
+            guess_widgets = app.query(guesses_displays.GuessFromListDisplay)
+            await pilot.press("A", "P", "P", "L", "E", "enter")
+            assert guess_input.disabled
+
+            await pilot.press("ctrl+n")
+
+            assert app.game_ is not game
+            assert app.query_exactly_one(guess_input_module.GuessInput) is guess_input
+            assert not guess_input.disabled
+            assert guess_input.value == ""
+            assert not app.query(target_displays.TargetDisplay)
+            assert "#" in str(guess_widgets[0].render())
+            label = app.query_exactly_one("#game_messages", widgets.Label)
+            assert "new game" in str(label.render()).lower()
+
+    async def test_new_game_recomposes_when_guess_limit_changes(
+        self,
+        app_with_wordle_game: app_module.WordallApp,
+        mocker: pytest_mock.MockerFixture,
+        mock_valid_dictionary_word_loader_5_letter: mock.MagicMock,
+    ) -> None:
+        app = app_with_wordle_game
+
+        def get_game(self: app_module.WordallApp, game_key: str) -> wordle.WordleGame:  # noqa: ARG001
+            return wordle.WordleGame(
+                mock_valid_dictionary_word_loader_5_letter,
+                guess_limit=6,
+                target_word_length=5,
+            )
+
+        async with app.run_test() as pilot:
+            guess_input = app.query_exactly_one(guess_input_module.GuessInput)
+            assert len(app.query(guesses_displays.GuessFromListDisplay)) == 5
+
+            mocker.patch("wordall.tui.app.WordallApp.get_game", get_game)
+            await pilot.press("ctrl+n")
+            await pilot.pause()
+
+            assert len(app.query(guesses_displays.GuessFromListDisplay)) == 6
+            new_guess_input = app.query_exactly_one(guess_input_module.GuessInput)
+            assert new_guess_input is not guess_input
+
+    async def test_new_game_removes_guesses_when_no_guess_limit(
+        self, app_with_wordle_game_no_limit: app_module.WordallApp
+    ) -> None:
+        app = app_with_wordle_game_no_limit
+        game = cast(wordle.WordleGame, app.game_)
+        game.target = "APPLE"
+
+        async with app.run_test() as pilot:
+            guesses_widget = app.query_exactly_one(
+                guesses_displays.GuessesFromListDisplay
+            )
+            await pilot.press("B", "R", "E", "A", "D", "enter")
+            assert len(guesses_widget.children) == 1
+
+            await pilot.press("ctrl+n")
+
+            assert len(guesses_widget.children) == 0